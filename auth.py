@@ -2,19 +2,35 @@
 Human-in-the-loop authentication module for Skoob.
 
 Opens the Skoob login page in a visible browser and waits for the user
-to press Enter in the terminal after logging in manually.
+to press Enter in the terminal after logging in manually. The resulting
+session can be saved to disk and reused by later runs.
 """
 
-import time
+import json
 import re
+from pathlib import Path
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from playwright.sync_api import Page
+import requests
 from loguru import logger
+from requests.adapters import HTTPAdapter
 
-from config import SKOOB_LOGIN_URL
+from config import (
+    API_WORKERS,
+    SKOOB_LOGIN_URL,
+    SKOOB_STATE_FILE,
+    SKOOB_USER_HOME_URL,
+)
 
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
 
-def wait_for_login(page: Page) -> str:
+_USER_ID_RE = re.compile(r"/usuario/(\d+)")
+_CONTENT_USER_ID_RE = re.compile(r"usuario[/_](\d+)")
+
+
+def wait_for_login(page: "Page") -> str:
     """
     Navigate to Skoob login and wait for the user to confirm login via terminal.
 
@@ -39,35 +55,127 @@ def wait_for_login(page: Page) -> str:
 
     logger.success("User confirmed login. Resuming automation.")
 
-    # Give the page a moment to settle after login
-    time.sleep(2)
+    # Let any post-login navigation settle
+    page.wait_for_load_state("domcontentloaded")
 
     # Try to resolve the user_id
     user_id = _resolve_user_id(page)
     return user_id
 
 
-def _resolve_user_id(page: Page) -> str:
+def _resolve_user_id(page: "Page") -> str:
     """Try to extract the Skoob user_id by navigating to the user profile."""
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
     try:
-        page.goto("https://www.skoob.com.br/usuario/home", wait_until="domcontentloaded")
-        time.sleep(2)
+        page.goto(SKOOB_USER_HOME_URL, wait_until="domcontentloaded")
 
-        match = re.search(r"/usuario/(\d+)", page.url)
-        if match:
-            uid = match.group(1)
-            logger.info(f"Resolved user_id={uid} from profile redirect.")
-            return uid
+        # The profile redirect lands on /usuario/<id>; wait for it to fire
+        try:
+            page.wait_for_url(_USER_ID_RE, timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
 
-        # Try extracting from page content
-        content = page.content()
-        match = re.search(r'usuario[/_](\d+)', content)
-        if match:
-            uid = match.group(1)
-            logger.info(f"Resolved user_id={uid} from page content.")
+        uid = _user_id_from_profile(page.url, page.content)
+        if uid:
             return uid
     except Exception:
         pass
 
     logger.warning("Could not resolve Skoob user_id. Shelf scraping may require manual URL.")
     return ""
+
+
+def _user_id_from_profile(url: str, get_content: Callable[[], str]) -> str:
+    """
+    Extract the user_id from the profile page at *url*: from the redirect
+    target first, then from the page content (only fetched if needed).
+
+    Returns an empty string if neither contains it.
+    """
+    match = _USER_ID_RE.search(url)
+    if match:
+        uid = match.group(1)
+        logger.info(f"Resolved user_id={uid} from profile redirect.")
+        return uid
+
+    # Try extracting from page content
+    match = _CONTENT_USER_ID_RE.search(get_content())
+    if match:
+        uid = match.group(1)
+        logger.info(f"Resolved user_id={uid} from page content.")
+        return uid
+
+    return ""
+
+
+def build_http_session(context: "BrowserContext") -> requests.Session:
+    """
+    Build a ``requests.Session`` carrying the authenticated browser cookies.
+
+    Lets JSON endpoints be called directly over HTTPS instead of being
+    rendered in a browser tab.
+    """
+    return _session_from_cookies(context.cookies())
+
+
+def save_session_state(context: "BrowserContext", path: str = SKOOB_STATE_FILE) -> None:
+    """Persist the browser's cookies so the next run can skip the login."""
+    context.storage_state(path=path)
+    logger.info(f"Saved Skoob session to {path}.")
+
+
+def load_saved_session(
+    path: str = SKOOB_STATE_FILE,
+) -> tuple[requests.Session, str] | None:
+    """
+    Restore a session saved by ``save_session_state`` if it is still valid.
+
+    Validity is checked by requesting the profile page and resolving the
+    user_id from it the same way a live login does (``_resolve_user_id``).
+
+    Returns:
+        ``(session, user_id)``, or ``None`` if there is no saved session or
+        it has expired.
+    """
+    state_path = Path(path)
+    if not state_path.exists():
+        return None
+
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+        session = _session_from_cookies(state.get("cookies", []))
+        response = session.get(SKOOB_USER_HOME_URL, timeout=30)
+    except Exception as exc:
+        logger.warning(f"Could not restore saved Skoob session: {exc}")
+        return None
+
+    uid = ""
+    if "/login" not in response.url:
+        uid = _user_id_from_profile(response.url, lambda: response.text)
+    if not uid:
+        session.close()
+        logger.info("Saved Skoob session has expired. A new login is required.")
+        return None
+
+    logger.info(f"Reusing saved Skoob session (user_id={uid}).")
+    return session, uid
+
+
+def _session_from_cookies(cookies: list[dict[str, Any]]) -> requests.Session:
+    """Load Playwright-style cookie dicts into a new ``requests.Session``."""
+    session = requests.Session()
+
+    # Keep one reusable keep-alive connection per concurrent API worker;
+    # the default pool of 10 would drop (and later re-handshake) the extras
+    adapter = HTTPAdapter(pool_maxsize=API_WORKERS)
+    session.mount("https://", adapter)
+
+    for cookie in cookies:
+        session.cookies.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ""),
+            path=cookie.get("path", "/"),
+        )
+    return session
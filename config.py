@@ -6,16 +6,25 @@ Configuration constants, URLs, and shelf mappings for the Goodreads ↔ Skoob sy
 GOODREADS_EXPORT_FILE: str = "input/goodreads_library_export.csv"
 FAILED_BOOKS_FILE: str = "failed_books.csv"
 SKOOB_EXPORT_FILE: str = "skoob_export_for_goodreads.csv"
+# Saved Skoob browser session (cookies) — lets later runs skip the manual login
+SKOOB_STATE_FILE: str = "skoob_state.json"
+# Book → Skoob page URL lookups from previous Goodreads → Skoob runs
+SKOOB_URL_CACHE_FILE: str = "skoob_url_cache.json"
 
 # --- Skoob URLs ---
 SKOOB_LOGIN_URL: str = "https://www.skoob.com.br/login"
 SKOOB_BASE_URL: str = "https://www.skoob.com.br"
+# Redirects to /usuario/<id> when logged in
+SKOOB_USER_HOME_URL: str = "https://www.skoob.com.br/usuario/home"
 
 # v1 JSON API for reading bookcase (uses session cookies from browser)
 SKOOB_V1_BOOKCASE_URL: str = (
     "https://www.skoob.com.br/v1/bookcase/books/{user_id}"
     "/shelf_id:{shelf_id}/page:{page}/limit:{limit}/"
 )
+# Bookshelf write API the book page calls when a status is set
+# (PUT .../bookshelf/add, seen in skoob_api_calls.json)
+SKOOB_BOOKSHELF_API_URL: str = "https://prd-api.skoob.com.br/api/v1/bookshelf/"
 
 # --- Goodreads shelf → Skoob status (for Goodreads → Skoob) ---
 # Only "read" is enabled for now; uncomment the others when ready.
@@ -53,3 +62,15 @@ SKOOB_STATUS_LABEL_TO_ID: dict[str, int] = {
 # --- Timing ---
 JITTER_MIN: float = 2.5
 JITTER_MAX: float = 5.0
+
+# Skoob API politeness: at most API_RATE_LIMIT requests per API_RATE_PERIOD seconds.
+# 16/min matches the old 2.5-5 s jitter between pages (3.75 s on average).
+API_RATE_LIMIT: int = 16
+API_RATE_PERIOD: float = 60.0
+
+# Books not found on Skoob are not searched again for this long (seconds)
+NOT_FOUND_CACHE_TTL: float = 24 * 60 * 60
+
+# --- Concurrency ---
+# Bookcase API requests in flight at once, across all shelves (Skoob → Goodreads)
+API_WORKERS: int = 10
@@ -10,14 +10,15 @@ Usage:
 import argparse
 import sys
 
-from playwright.sync_api import sync_playwright
 from loguru import logger
 
-from config import GOODREADS_EXPORT_FILE
-from auth import wait_for_login
-from etl import load_goodreads_csv
-import sync_to_skoob
-import sync_to_goodreads
+from config import GOODREADS_EXPORT_FILE, SKOOB_STATE_FILE
+
+# Playwright, pandas and the sync modules are imported inside main() only on
+# the branches that need them, so --help and the browserless path start fast.
+
+_TO_SKOOB_DIRECTIONS = frozenset({"to-skoob", "both"})
+_TO_GOODREADS_DIRECTIONS = frozenset({"to-goodreads", "both"})
 
 
 def parse_args() -> argparse.Namespace:
@@ -41,6 +42,11 @@ def parse_args() -> argparse.Namespace:
         default=GOODREADS_EXPORT_FILE,
         help=f"Path to the Goodreads export CSV (default: {GOODREADS_EXPORT_FILE}).",
     )
+    parser.add_argument(
+        "--force-login",
+        action="store_true",
+        help=f"Ignore the saved Skoob session ({SKOOB_STATE_FILE}) and log in again.",
+    )
     return parser.parse_args()
 
 
@@ -52,7 +58,7 @@ def main() -> None:
     logger.info(f"Direction: {direction}")
 
     # Pre-flight check: if we need the Goodreads CSV, make sure it exists
-    needs_csv = direction in ("to-skoob", "both")
+    needs_csv = direction in _TO_SKOOB_DIRECTIONS
     if needs_csv:
         from pathlib import Path
 
@@ -63,25 +69,69 @@ def main() -> None:
             )
             sys.exit(1)
 
+    from auth import (
+        build_http_session,
+        load_saved_session,
+        save_session_state,
+        wait_for_login,
+    )
+
+    saved = None if args.force_login else load_saved_session()
+
+    # Skoob → Goodreads only talks to the JSON API, so a saved session
+    # means the browser is not needed at all
+    if saved and direction == "to-goodreads":
+        import sync_to_goodreads
+
+        session, user_id = saved
+        logger.info("═══ Skoob → Goodreads ═══")
+        with session:
+            sync_to_goodreads.run(session, user_id)
+        logger.info("All done. 🎉")
+        return
+
+    from playwright.sync_api import sync_playwright
+
     with sync_playwright() as pw:
         browser = pw.chromium.launch(headless=False)
-        context = browser.new_context()
-        page = context.new_page()
 
-        # Authenticate (always required)
-        user_id = wait_for_login(page)
+        if saved:
+            # The browser context carries the cookies from here on
+            session, user_id = saved
+            session.close()
+            context = browser.new_context(storage_state=SKOOB_STATE_FILE)
+            page = context.new_page()
+        else:
+            context = browser.new_context()
+            page = context.new_page()
+
+            # Authenticate
+            user_id = wait_for_login(page)
+
+            # A session without a resolvable user_id would be rejected on reload
+            if user_id:
+                save_session_state(context)
 
         # --- Goodreads → Skoob ---
-        if direction in ("to-skoob", "both"):
+        if direction in _TO_SKOOB_DIRECTIONS:
+            from etl import load_goodreads_csv
+            import sync_to_skoob
+
             logger.info("═══ Goodreads → Skoob ═══")
             df = load_goodreads_csv(args.csv)
             sync_to_skoob.run(page, df)
 
         # --- Skoob → Goodreads ---
-        if direction in ("to-goodreads", "both"):
+        if direction in _TO_GOODREADS_DIRECTIONS:
+            import sync_to_goodreads
+
             logger.info("═══ Skoob → Goodreads ═══")
-            sync_to_goodreads.run(page, user_id)
+            with build_http_session(context) as session:
+                sync_to_goodreads.run(session, user_id)
 
+        # Keep cookies Skoob refreshed during the run for the next one
+        if user_id:
+            save_session_state(context)
         browser.close()
 
     logger.info("All done. 🎉")
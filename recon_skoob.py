@@ -6,31 +6,91 @@ ALL network requests/responses while you manually:
   1. Search for a book
   2. Add it to "Lido" (or any shelf)
 
-The captured API calls are saved to 'skoob_api_calls.json' so we can
+The captured API calls are streamed to 'skoob_api_calls.ndjson' as they
+happen and converted to 'skoob_api_calls.json' at the end, so we can
 replicate them in the sync script.
 
+Repeated calls to the same endpoint (same method and URL, ignoring the
+query string) are captured only once unless --keep-duplicates is given.
+
 Usage:
     python recon_skoob.py
+    python recon_skoob.py --keep-duplicates   # full trace, for debugging
 """
 
+import argparse
 import json
+import re
 import time
+from urllib.parse import urlsplit
+
 from playwright.sync_api import sync_playwright
 
+# Responses worth reading the body of (API-like URLs only)
+_INTERESTING_RESPONSE_RE = re.compile(
+    r"/v1/|/api/|/search|/bookcase|/bookshelf|/estante|status|shelf|rating"
+)
+
+# URLs listed in the end-of-session summary
+_SUMMARY_KEYWORDS_RE = re.compile(
+    r"/v1/|/api/|search|bookshelf|bookcase|estante|status|shelf|livro|rating|book"
+)
+
+# Upper bound on captured entries to keep long sessions bounded
+MAX_CAPTURES = 5000
+
+CAPTURE_STREAM_FILE = "skoob_api_calls.ndjson"
+CAPTURE_OUTPUT_FILE = "skoob_api_calls.json"
 
-def main() -> None:
-    captured: list[dict] = []
 
-    with sync_playwright() as pw:
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Capture Skoob network traffic.")
+    parser.add_argument(
+        "--keep-duplicates",
+        action="store_true",
+        help="Capture repeated calls to the same endpoint instead of only the first.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    seen: set[str] = set()
+    captured_count = 0
+    stream = open(CAPTURE_STREAM_FILE, "w", encoding="utf-8")
+
+    def record(entry: dict) -> None:
+        """Append one captured entry to the NDJSON stream."""
+        nonlocal captured_count
+        stream.write(json.dumps(entry, default=str, ensure_ascii=False) + "\n")
+        stream.flush()
+        captured_count += 1
+
+    def is_duplicate(kind: str, method: str, url: str) -> bool:
+        """Return True if this (method, URL-without-query) was already captured."""
+        if args.keep_duplicates:
+            return False
+        key = f"{kind}|{method}|{urlsplit(url)._replace(query='').geturl()}"
+        if key in seen:
+            return True
+        seen.add(key)
+        return False
+
+    with stream, sync_playwright() as pw:
         browser = pw.chromium.launch(headless=False)
         context = browser.new_context()
         page = context.new_page()
 
         # --- Capture all network requests ---
         def on_request(request):
+            if captured_count >= MAX_CAPTURES:
+                return
             # Only capture API-like requests (XHR, fetch, not images/css)
             resource = request.resource_type
             if resource in ("xhr", "fetch", "document"):
+                if is_duplicate("request", request.method, request.url):
+                    return
                 entry = {
                     "method": request.method,
                     "url": request.url,
@@ -38,16 +98,20 @@ def main() -> None:
                     "headers": dict(request.headers),
                     "post_data": request.post_data,
                 }
-                captured.append(entry)
+                record(entry)
                 print(f"  >> {request.method} {request.url}")
 
         def on_response(response):
+            if captured_count >= MAX_CAPTURES:
+                return
             url = response.url
-            # Only log interesting API responses
-            if any(kw in url for kw in ["/v1/", "/api/", "/search", "/livro",
-                                         "/bookcase", "/bookshelf", "/estante",
-                                         "/user/", "/usuario/", "status",
-                                         "shelf", "rating"]):
+            # Only log interesting API responses; gated before any body is
+            # pulled over the protocol
+            if (
+                response.request.resource_type in ("xhr", "fetch")
+                and _INTERESTING_RESPONSE_RE.search(url)
+                and not is_duplicate("response", response.request.method, url)
+            ):
                 content_type = response.headers.get("content-type", "")
                 body = ""
                 try:
@@ -63,7 +127,7 @@ def main() -> None:
                     "content_type": content_type,
                     "body_preview": body[:2000] if body else "",
                 }
-                captured.append(entry)
+                record(entry)
                 print(f"  << {response.status} {url}")
                 if body and len(body) < 500:
                     print(f"     Body: {body[:300]}")
@@ -97,34 +161,35 @@ def main() -> None:
 
         browser.close()
 
-    # --- Save captured data ---
-    output = {
-        "captured_requests": captured,
-        "skoob_cookies": skoob_cookies,
-    }
-
-    with open("skoob_api_calls.json", "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False, default=str)
-
-    print(f"\n✅ Captured {len(captured)} requests/responses.")
-    print(f"   Saved to: skoob_api_calls.json")
+    # --- Convert the NDJSON stream into the final JSON document ---
+    with open(CAPTURE_STREAM_FILE, encoding="utf-8") as src, \
+            open(CAPTURE_OUTPUT_FILE, "w", encoding="utf-8") as f:
+        f.write('{\n  "captured_requests": [\n')
+        for i, line in enumerate(src):
+            f.write((",\n    " if i else "    ") + line.rstrip("\n"))
+        f.write('\n  ],\n  "skoob_cookies": ')
+        json.dump(skoob_cookies, f, ensure_ascii=False, default=str)
+        f.write("\n}\n")
+
+    print(f"\n✅ Captured {captured_count} requests/responses.")
+    print(f"   Saved to: {CAPTURE_OUTPUT_FILE}")
     print(f"   Skoob cookies: {len(skoob_cookies)}")
 
     # --- Print summary of interesting calls ---
     print("\n📋 INTERESTING API CALLS:")
     print("-" * 70)
-    for entry in captured:
-        url = entry.get("url", "")
-        if any(kw in url for kw in ["/v1/", "/api/", "search", "bookshelf",
-                                     "bookcase", "estante", "status", "shelf",
-                                     "livro", "rating", "book"]):
-            method = entry.get("method", entry.get("_type", "?"))
-            print(f"  {method:6s} {url}")
-            if entry.get("post_data"):
-                print(f"         POST body: {entry['post_data'][:200]}")
-            if entry.get("body_preview"):
-                print(f"         Response: {entry['body_preview'][:200]}")
-            print()
+    with open(CAPTURE_STREAM_FILE, encoding="utf-8") as src:
+        for line in src:
+            entry = json.loads(line)
+            url = entry.get("url", "")
+            if _SUMMARY_KEYWORDS_RE.search(url):
+                method = entry.get("method", entry.get("_type", "?"))
+                print(f"  {method:6s} {url}")
+                if entry.get("post_data"):
+                    print(f"         POST body: {entry['post_data'][:200]}")
+                if entry.get("body_preview"):
+                    print(f"         Response: {entry['body_preview'][:200]}")
+                print()
 
 
 if __name__ == "__main__":
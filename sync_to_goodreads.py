@@ -5,129 +5,210 @@ Scrapes the authenticated user's Skoob shelves using the v1 JSON API
 and produces a Goodreads-compatible CSV via ``etl.generate_goodreads_csv``.
 """
 
+import itertools
 import time
-import json
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any
 
-from playwright.sync_api import Page
+import orjson
+import requests
 from loguru import logger
 
 from config import (
     SKOOB_STATUS_IDS,
     SKOOB_TO_GOODREADS_SHELF,
     SKOOB_V1_BOOKCASE_URL,
-    JITTER_MIN,
-    JITTER_MAX,
+    API_RATE_LIMIT,
+    API_RATE_PERIOD,
+    API_WORKERS,
 )
 from etl import generate_goodreads_csv
 
-import random
+
+class _RateLimiter:
+    """
+    Thread-safe sliding-window limiter: at most *max_calls* per *period* seconds.
+
+    Allows bursts while the server is fast but keeps the same long-run request
+    rate as a fixed sleep between pages.
+    """
+
+    def __init__(self, max_calls: int, period: float) -> None:
+        self._max_calls = max_calls
+        self._period = period
+        self._calls: deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another request is allowed, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self._period:
+                    self._calls.popleft()
+                if len(self._calls) < self._max_calls:
+                    self._calls.append(now)
+                    return
+                delay = self._period - (now - self._calls[0])
+            time.sleep(delay)
+
+
+# Books requested per bookcase API page
+_PAGE_LIMIT = 100
+
+# Shared by every API worker so the limit applies to the whole run
+_LIMITER = _RateLimiter(API_RATE_LIMIT, API_RATE_PERIOD)
+
 
 # ---------------------------------------------------------------------------
 # Public
 # ---------------------------------------------------------------------------
 
-def run(page: Page, user_id: str) -> None:
+def run(session: requests.Session, user_id: str) -> None:
     """
     Read books from Skoob shelves and generate a Goodreads-compatible CSV.
+
+    *session* must carry the authenticated Skoob cookies
+    (see ``auth.build_http_session``).
     """
     if not user_id:
         logger.error("No Skoob user_id available. Cannot scrape shelves.")
         logger.info("Please pass your numeric Skoob user ID manually.")
         return
 
-    all_books: list[dict[str, Any]] = []
-
+    shelves: list[tuple[int, str, str]] = []
     for status_id, status_label in SKOOB_STATUS_IDS.items():
         goodreads_shelf = SKOOB_TO_GOODREADS_SHELF.get(status_label)
         if not goodreads_shelf:
             logger.debug(f"Skipping Skoob shelf '{status_label}' (no Goodreads mapping).")
             continue
+        shelves.append((status_id, status_label, goodreads_shelf))
 
-        logger.info(f"Scraping Skoob shelf: {status_label} (id={status_id})...")
-        books = _scrape_shelf_via_api(page, user_id, status_id, status_label, goodreads_shelf)
-        all_books.extend(books)
-        logger.info(f"  Found {len(books)} books in '{status_label}'.")
-
-    if all_books:
-        generate_goodreads_csv(all_books)
-    else:
+    # Rows are written as pages arrive instead of after all shelves finish
+    books = _iter_books(session, user_id, shelves)
+    first = next(books, None)
+    if first is None:
         logger.warning("No books found on Skoob shelves.")
+        return
+
+    generate_goodreads_csv(itertools.chain([first], books))
 
 
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
-def _scrape_shelf_via_api(
-    page: Page,
+def _iter_books(
+    session: requests.Session,
     user_id: str,
-    status_id: int,
-    status_label: str,
-    goodreads_shelf: str,
-) -> list[dict[str, Any]]:
+    shelves: list[tuple[int, str, str]],
+) -> Iterator[dict[str, Any]]:
     """
-    Scrape all books from a Skoob shelf using the v1 JSON API.
-
-    Uses Playwright to make requests with the authenticated session cookies.
-    The API endpoint returns JSON with pagination.
+    Scrape all books from *shelves* using the v1 JSON API, yielding them as
+    their pages arrive.
+
+    Requests are issued directly over HTTPS with the session cookies captured
+    from the authenticated browser, so no page has to be rendered. Every
+    shelf's first page is requested at once; each one tells us how many pages
+    that shelf has, and the rest are queued on the same pool. The pool size
+    bounds the total number of requests in flight.
     """
-    books: list[dict[str, Any]] = []
-    current_page = 1
-    limit = 50
-
-    while True:
-        url = SKOOB_V1_BOOKCASE_URL.format(
-            user_id=user_id,
-            shelf_id=status_id,
-            page=current_page,
-            limit=limit,
-        )
-
-        logger.debug(f"  Fetching: {url}")
-
-        try:
-            # Use Playwright to make the request with session cookies
-            response = page.goto(url, wait_until="domcontentloaded")
-            page.wait_for_timeout(1000)
-
-            # Try to parse the page content as JSON
-            content = page.inner_text("body")
-            if not content or content.strip() == "":
-                logger.debug(f"  Empty response on page {current_page}, stopping.")
-                break
+    found = {status_label: 0 for _, status_label, _ in shelves}
+
+    with ThreadPoolExecutor(max_workers=API_WORKERS) as pool:
+        pending: dict[Future, tuple[tuple[int, str, str], int]] = {}
+        for shelf in shelves:
+            status_id, status_label, _ = shelf
+            logger.info(f"Scraping Skoob shelf: {status_label} (id={status_id})...")
+            future = pool.submit(_fetch_page, session, user_id, status_id, 1)
+            pending[future] = (shelf, 1)
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                shelf, page = pending.pop(future)
+                status_id, status_label, goodreads_shelf = shelf
+
+                data = future.result()
+                if data is None:
+                    continue
+                response_list = data.get("response", [])
+
+                if page == 1:
+                    for next_page in _remaining_pages(data):
+                        next_future = pool.submit(
+                            _fetch_page, session, user_id, status_id, next_page
+                        )
+                        pending[next_future] = (shelf, next_page)
+
+                books = _parse_page(response_list, goodreads_shelf, status_label)
+                found[status_label] += len(books)
+                yield from books
+
+    for status_label, count in found.items():
+        logger.info(f"  Found {count} books in '{status_label}'.")
+
+
+def _remaining_pages(first_page: dict[str, Any]) -> range:
+    """
+    Pages still to fetch for a shelf, given its decoded first page.
 
-            data = json.loads(content)
-            response_list = data.get("response", [])
+    ``paging.total_pages`` is authoritative: the server may serve fewer than
+    ``_PAGE_LIMIT`` books per page, so a short first page does not mean the
+    shelf is complete. Without paging info only the first page is read.
+    """
+    paging = first_page.get("paging", {})
+    total_pages = paging.get("total_pages", 1) if paging else 1
+    return range(2, total_pages + 1)
 
-            if not response_list:
-                logger.debug(f"  No more books on page {current_page}.")
-                break
 
-            for item in response_list:
-                book = _parse_api_book(item, goodreads_shelf, status_label)
-                if book:
-                    books.append(book)
+def _fetch_page(
+    session: requests.Session,
+    user_id: str,
+    status_id: int,
+    page: int,
+) -> dict[str, Any] | None:
+    """Fetch one bookcase page; returns the decoded JSON, or None on failure."""
+    url = SKOOB_V1_BOOKCASE_URL.format(
+        user_id=user_id,
+        shelf_id=status_id,
+        page=page,
+        limit=_PAGE_LIMIT,
+    )
 
-            logger.debug(f"  Page {current_page}: {len(response_list)} books.")
+    logger.debug("  Fetching: {}", url)
 
-            # Check if there are more pages
-            paging = data.get("paging", {})
-            total_pages = paging.get("total_pages", 1) if paging else 1
-            if current_page >= total_pages:
-                break
+    try:
+        _LIMITER.acquire()
+        response = session.get(url, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        logger.warning(f"  Could not parse JSON on page {page}. "
+                      "Skoob may require different auth or the API has changed.")
+        return None
+    except Exception as exc:
+        logger.error(f"  Error fetching shelf page {page}: {exc}")
+        return None
 
-            current_page += 1
-            _jitter()
+    logger.debug("  Page {}: {} books.", page, len(data.get("response", [])))
+    return data
 
-        except json.JSONDecodeError:
-            logger.warning(f"  Could not parse JSON on page {current_page}. "
-                          "Skoob may require different auth or the API has changed.")
-            break
-        except Exception as exc:
-            logger.error(f"  Error fetching shelf page {current_page}: {exc}")
-            break
 
+def _parse_page(
+    response_list: list[dict[str, Any]],
+    goodreads_shelf: str,
+    status_label: str,
+) -> list[dict[str, Any]]:
+    """Parse every item of one API page, dropping those that fail to parse."""
+    books: list[dict[str, Any]] = []
+    for item in response_list:
+        book = _parse_api_book(item, goodreads_shelf, status_label)
+        if book:
+            books.append(book)
     return books
 
 
@@ -169,8 +250,3 @@ def _parse_api_book(
         logger.warning(f"  Failed to parse book: {exc}")
         return None
 
-
-def _jitter() -> None:
-    """Random sleep to mimic human behaviour."""
-    delay = random.uniform(JITTER_MIN, JITTER_MAX)
-    time.sleep(delay)
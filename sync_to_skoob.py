@@ -5,14 +5,23 @@ Uses Playwright to:
   1. Type a book name in Skoob's search bar.
   2. Click on the first autocomplete dropdown result.
   3. On the book detail page, click the appropriate reading status button.
+
+Book page URLs found by the search are cached in ``SKOOB_URL_CACHE_FILE`` so
+re-runs open them directly.
 """
 
+import hashlib
+import json
 import random
+import re
 import time
+from pathlib import Path
 from typing import Any
+from urllib.parse import urljoin, urlsplit
 
 import pandas as pd
-from playwright.sync_api import Page, Locator
+from playwright.sync_api import Page, Locator, Response
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from loguru import logger
 
 from config import (
@@ -20,10 +29,120 @@ from config import (
     GOODREADS_TO_SKOOB_SHELF,
     JITTER_MAX,
     JITTER_MIN,
+    NOT_FOUND_CACHE_TTL,
     SKOOB_BASE_URL,
+    SKOOB_BOOKSHELF_API_URL,
+    SKOOB_URL_CACHE_FILE,
+)
+
+# Save the URL cache after this many new lookups (and at the end of the run)
+_URL_CACHE_SAVE_EVERY = 10
+
+# Trailing parenthetical in Goodreads titles, e.g. "(Portuguese Edition)"
+_PAREN_SUFFIX_RE = re.compile(r"\s*\(.*?\)\s*$")
+
+_SEARCH_INPUT_SELECTOR = ", ".join([
+    "input[type='search']",
+    "input[name='search']",
+    "input[name='q']",
+    "input[placeholder*='uscar']",     # Buscar
+    "input[placeholder*='esquis']",    # Pesquisar
+    "input[placeholder*='ivro']",      # livro
+    "#search",
+    ".search-input",
+    "header input[type='text']",
+    "nav input[type='text']",
+])
+_SEARCH_INPUT_FALLBACK_SELECTOR = "input[type='text']"
+
+# Homepage paths with the search bar; SKOOB_BASE_URL redirects to /pt
+_SEARCH_PAGE_PATHS = ("", "/pt")
+
+# Autocomplete result entries (based on Skoob's current UI)
+_DROPDOWN_RESULT_SELECTOR = ", ".join([
+    ".dropdown-menu a[href*='/livro/']",
+    ".autocomplete a[href*='/livro/']",
+    ".search-results a[href*='/livro/']",
+    ".suggestions a[href*='/livro/']",
+    ".dropdown-item",
+    ".autocomplete-item",
+    ".suggestion-item",
+])
+
+# Book results outside a recognised dropdown (based on Skoob's current UI)
+_RESULT_CARD_SELECTOR = ", ".join([
+    # Any link to a livro page that appeared after typing
+    "a[href*='/livro/']:not(nav a):not(header a):not(footer a)",
+    # The book result cards visible in the screenshot
+    ".livro-capa",
+    ".box_livro a",
+])
+
+# Button text variations for each Skoob status, most specific first.
+# :has-text() matching is case-insensitive and by substring.
+_STATUS_TEXT_VARIANTS: dict[str, tuple[str, ...]] = {
+    "Lido": ("Lido", "Li"),
+    "Lendo": ("Lendo", "Estou lendo"),
+    "Quero Ler": ("Quero ler", "Vou ler"),
+}
+
+# Common Skoob status button IDs per status, tried after the text matches
+_STATUS_ID_SELECTORS: dict[str, str] = {
+    "Lido": "#bt_lido, #btn-lido, #btn-status-1",
+    "Lendo": "#bt_lendo, #btn-lendo, #btn-status-2",
+    "Quero Ler": "#bt_quero, #btn-quero, #btn-status-3",
+}
+
+
+# Buttons are tried before links for each text variant, so a nav link such
+# as "Mais lidos" cannot win over the book's own status button
+_STATUS_CONTROL_TAGS: tuple[tuple[str, ...], ...] = (
+    ("button", "[role='button']"),
+    ("a", "[role='link']"),
 )
 
 
+def _status_selectors(target_status: str) -> tuple[str, ...]:
+    """
+    Button and link selectors for each text variant of *target_status*,
+    then its IDs.
+    """
+    texts = _STATUS_TEXT_VARIANTS.get(target_status, (target_status,))
+    by_text = tuple(
+        ", ".join(f"{tag}:has-text('{text}')" for tag in tags)
+        for text in texts
+        for tags in _STATUS_CONTROL_TAGS
+    )
+    ids = _STATUS_ID_SELECTORS.get(target_status)
+    return by_text + (ids,) if ids else by_text
+
+
+_STATUS_SELECTORS: dict[str, tuple[str, ...]] = {
+    status: _status_selectors(status) for status in _STATUS_TEXT_VARIANTS
+}
+
+# Everything _click_dropdown_result accepts as a search result
+_SEARCH_RESULT_SELECTOR = f"{_DROPDOWN_RESULT_SELECTOR}, {_RESULT_CARD_SELECTOR}"
+
+# Whether the autocomplete only reacts to real key events. Decided by the
+# first query that shows results (see _search_via_dropdown); reset per run.
+_needs_key_events: bool | None = None
+
+# Returns the href of the first visible search-result /livro/ link, skipping
+# list/review links and anything above the search bar (y <= 80px).
+_FIND_LIVRO_LINK_JS = """
+() => {
+    for (const a of document.querySelectorAll("a[href*='/livro/']")) {
+        const href = a.getAttribute("href") || "";
+        if (href.includes("/lista/") || href.includes("/resenhas/")) continue;
+        const box = a.getBoundingClientRect();
+        if (box.width > 0 && box.height > 0 && box.y > 80) return href;
+    }
+    return null;
+}
+"""
+
+
 # ---------------------------------------------------------------------------
 # Public
 # ---------------------------------------------------------------------------
@@ -34,31 +153,93 @@ def run(page: Page, df: pd.DataFrame) -> None:
 
     Books that fail are collected and saved to ``FAILED_BOOKS_FILE``.
     """
-    failed: list[dict[str, Any]] = []
+    global _needs_key_events
+    _needs_key_events = None
+
+    # Drop duplicate rows so the same book is not searched twice
+    unfiltered = len(df)
+    df = df.drop_duplicates(subset=["Title", "Author", "Exclusive Shelf"])
+    if len(df) < unfiltered:
+        logger.info(f"Skipping {unfiltered - len(df)} duplicate row(s).")
+
+    # Resolve the Skoob status, search title and ISBN for every row up front,
+    # and drop rows whose shelf has no Skoob mapping
+    unmapped = len(df)
+    df = (
+        df.assign(
+            target_status=df["Exclusive Shelf"].map(GOODREADS_TO_SKOOB_SHELF),
+            clean_title=_clean_titles(df["Title"]),
+            clean_isbn=df["clean_isbn"].fillna("").astype(str).str.strip(),
+        )
+        .dropna(subset=["target_status"])
+        .reset_index(drop=True)
+    )
+    if len(df) < unmapped:
+        logger.info(f"Skipping {unmapped - len(df)} book(s) on unmapped shelves.")
+
+    failed: list[int] = []  # positional indices into df
     total = len(df)
     logger.info(f"Starting Goodreads → Skoob sync for {total} books...")
 
-    for seq, (_, row) in enumerate(df.iterrows(), start=1):
-        title: str = row.get("Title", "Unknown Title")
-        author: str = row.get("Author", "Unknown Author")
-        isbn: str = row.get("clean_isbn", "")
-        shelf: str = row.get("Exclusive Shelf", "")
-        target_status: str | None = GOODREADS_TO_SKOOB_SHELF.get(shelf)
+    url_cache = _load_url_cache()
+    try:
+        _sync_rows(page, df, url_cache, failed)
+    finally:
+        _save_url_cache(url_cache)
 
-        if not target_status:
-            logger.debug(f"Skipping '{title}': unmapped shelf '{shelf}'.")
-            continue
+    # Persist failures
+    if failed:
+        df.iloc[failed].to_csv(FAILED_BOOKS_FILE, index=False)
+        logger.warning(f"Done. {len(failed)} failure(s) saved to {FAILED_BOOKS_FILE}.")
+    else:
+        logger.success("Done — all books synced successfully!")
+
+
+# ---------------------------------------------------------------------------
+# Private helpers
+# ---------------------------------------------------------------------------
+
+def _sync_rows(
+    page: Page,
+    df: pd.DataFrame,
+    url_cache: dict[str, dict[str, Any]],
+    failed: list[int],
+) -> None:
+    """Open each book on Skoob and set its status; append failures to *failed*."""
+    total = len(df)
+    pending_saves = 0
+
+    rows = list(df.itertuples(index=False, name="Book"))
+    for seq, row in enumerate(rows, start=1):
+        title: str = row.Title
+        author: str = row.Author
+        isbn: str = row.clean_isbn
+        clean_title: str = row.clean_title
+        target_status: str = row.target_status
 
         logger.info(f"[{seq}/{total}] {title} ({author}) → {target_status}")
 
         try:
-            found = _search_and_open_book(page, isbn, title, author)
+            found, cache_updated = _search_and_open_book(
+                page, isbn, clean_title, author, url_cache
+            )
+
+            if cache_updated:
+                pending_saves += 1
+                if pending_saves >= _URL_CACHE_SAVE_EVERY:
+                    _save_url_cache(url_cache)
+                    pending_saves = 0
+
             if not found:
                 logger.error(f"Book not found on Skoob: {title}")
-                failed.append(row.to_dict())
+                failed.append(seq - 1)
                 continue
 
-            time.sleep(1)  # let book page render
+            # Let the book page render; a late load event is not a failure
+            try:
+                page.wait_for_load_state("load", timeout=5000)
+            except PlaywrightTimeoutError:
+                pass
 
             if _set_status(page, target_status, title):
                 logger.success(f"✔ '{title}' → '{target_status}'")
@@ -67,25 +248,27 @@ def run(page: Page, df: pd.DataFrame) -> None:
 
         except Exception as exc:
             logger.error(f"Unexpected error for '{title}': {exc}")
-            failed.append(row.to_dict())
-
-        _jitter()
-
-    # Persist failures
-    if failed:
-        pd.DataFrame(failed).to_csv(FAILED_BOOKS_FILE, index=False)
-        logger.warning(f"Done. {len(failed)} failure(s) saved to {FAILED_BOOKS_FILE}.")
-    else:
-        logger.success("Done — all books synced successfully!")
+            failed.append(seq - 1)
 
+        # Load the next book's search page now and count its load time
+        # towards the pause instead of adding it on top. Books the URL cache
+        # answers never use the search page, so it is not preloaded for them.
+        pause_started = time.monotonic()
+        if seq < total and not _answered_by_cache(url_cache, rows[seq]):
+            try:
+                _open_search_page(page)
+            except Exception as exc:
+                logger.debug(f"  Could not preload search page: {exc}")
+        _jitter(already_waited=time.monotonic() - pause_started)
 
-# ---------------------------------------------------------------------------
-# Private helpers
-# ---------------------------------------------------------------------------
 
 def _search_and_open_book(
-    page: Page, isbn: str, title: str, author: str
-) -> bool:
+    page: Page,
+    isbn: str,
+    clean_title: str,
+    author: str,
+    url_cache: dict[str, dict[str, Any]],
+) -> tuple[bool, bool]:
     """
     Search for a book on Skoob using the search bar autocomplete dropdown.
 
@@ -94,96 +277,186 @@ def _search_and_open_book(
       2. Title + Author
       3. Title only
 
-    Returns True if we end up on a /livro/ detail page.
+    *clean_title* is the Goodreads title without parenthetical suffixes
+    (see ``_clean_titles``). Results are recorded in *url_cache*: a cached
+    URL is opened directly, and a recent "not found" skips the search.
+    A search that could not run at all is not recorded.
+
+    Returns ``(found, cache_updated)``: whether we end up on a /livro/ detail
+    page, and whether *url_cache* was written.
+    """
+    key = _url_cache_key(isbn, clean_title, author)
+    cached = url_cache.get(key)
+    if cached:
+        if cached["url"]:
+            logger.debug("  Opening cached book page: {}", cached["url"])
+            page.goto(cached["url"], wait_until="domcontentloaded")
+            if "/livro/" in page.url:
+                return True, False
+        elif time.time() - cached["checked_at"] < NOT_FOUND_CACHE_TTL:
+            logger.debug("  Not found on a recent run; skipping search.")
+            return False, False
+
+    found = _search_book(page, isbn, clean_title, author)
+    if found is None:
+        return False, False
+
+    url_cache[key] = {"url": page.url if found else None, "checked_at": time.time()}
+    return found, True
+
+
+def _search_book(
+    page: Page, isbn: str, clean_title: str, author: str
+) -> bool | None:
+    """
+    Try each search query in turn; returns True once on a /livro/ page.
+
+    Returns None if no search could run (e.g. the search bar never loaded),
+    so a transient failure is not mistaken for "not on Skoob".
     """
     queries: list[tuple[str, str]] = []
     if isbn.strip():
         queries.append(("ISBN", isbn.strip()))
-    # Clean parenthetical suffixes like "(Portuguese Edition)" from title
-    clean_title = _clean_title(title)
     queries.append(("Title+Author", f"{clean_title} {author}"))
     queries.append(("Title only", clean_title))
 
+    searched = False
     for label, query in queries:
-        logger.debug(f"  Searching by {label}: {query}")
+        logger.debug("  Searching by {}: {}", label, query)
 
-        if _search_via_dropdown(page, query):
+        result = _search_via_dropdown(page, query)
+        if result:
             return True
+        if result is None:
+            continue
 
-        logger.debug(f"  No results for {label}.")
+        searched = True
+        logger.debug("  No results for {}.", label)
 
-    return False
+    return False if searched else None
 
 
-def _clean_title(title: str) -> str:
+def _clean_titles(titles: pd.Series) -> pd.Series:
     """Remove common Goodreads parenthetical suffixes that won't match on Skoob."""
-    import re
+    titles = titles.fillna("").astype(str)
     # e.g. "(Portuguese Edition)", "(The Foo #1)", etc.
-    cleaned = re.sub(r"\s*\(.*?\)\s*$", "", title).strip()
-    return cleaned if cleaned else title
+    cleaned = titles.str.replace(_PAREN_SUFFIX_RE, "", regex=True).str.strip()
+    return cleaned.mask(cleaned == "", titles)
 
 
-def _search_via_dropdown(page: Page, query: str) -> bool:
+def _search_via_dropdown(page: Page, query: str) -> bool | None:
     """
     Navigate to Skoob, type into the search bar, wait for autocomplete
     dropdown results, and click the first one.
 
-    Returns True if we end up on a /livro/ page.
+    Returns True if we end up on a /livro/ page, or None if the search
+    input could not be found.
     """
-    # Go to homepage to get a fresh search bar
-    page.goto(SKOOB_BASE_URL, wait_until="domcontentloaded")
-    page.wait_for_timeout(2000)
+    global _needs_key_events
+    _open_search_page(page)
 
     # Find the search input
     search_input = _find_search_input(page)
     if not search_input:
         logger.warning("  Could not find search input on page.")
-        return False
-
-    # Type the query slowly to trigger autocomplete
-    search_input.click()
-    search_input.fill("")
-    time.sleep(0.3)
-    search_input.type(query, delay=50)  # type char-by-char to trigger autocomplete
-
-    # Wait for autocomplete dropdown to appear
-    page.wait_for_timeout(2500)
+        return None
+
+    _type_query(search_input, query, key_events=bool(_needs_key_events))
+
+    # Wait for autocomplete results to appear. Until one query has shown
+    # results, a miss is retyped with key events to learn which input
+    # method the autocomplete needs; later misses are not retyped.
+    if _wait_for_results(page):
+        if _needs_key_events is None:
+            _needs_key_events = False
+    elif _needs_key_events is None:
+        _type_query(search_input, query, key_events=True)
+        if _wait_for_results(page):
+            logger.debug("  Autocomplete needs key events; typing from now on.")
+            _needs_key_events = True
 
     # Try to click the first autocomplete result
     if _click_dropdown_result(page):
         # Wait for book page to load
-        page.wait_for_load_state("domcontentloaded")
-        page.wait_for_timeout(1500)
+        try:
+            page.wait_for_url("**/livro/**", wait_until="domcontentloaded", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
 
         if "/livro/" in page.url:
-            logger.debug(f"  Navigated to book page: {page.url}")
+            logger.debug("  Navigated to book page: {}", page.url)
             return True
 
     return False
 
 
+def _open_search_page(page: Page) -> None:
+    """
+    Go to homepage to get a fresh search bar. Follow-up queries for the
+    same book (and a page preloaded during the pause) reuse it as is.
+    """
+    if _on_search_page(page):
+        return
+
+    page.goto(SKOOB_BASE_URL, wait_until="domcontentloaded")
+    try:
+        page.wait_for_selector(
+            f"{_SEARCH_INPUT_SELECTOR}, {_SEARCH_INPUT_FALLBACK_SELECTOR}",
+            state="visible",
+            timeout=10_000,
+        )
+    except PlaywrightTimeoutError:
+        pass  # _find_search_input reports the miss
+
+
+def _on_search_page(page: Page) -> bool:
+    """True if *page* is on the Skoob homepage (``/`` redirects to ``/pt``)."""
+    url = urlsplit(page.url)
+    return (
+        f"{url.scheme}://{url.netloc}" == SKOOB_BASE_URL
+        and url.path.rstrip("/") in _SEARCH_PAGE_PATHS
+    )
+
+
+def _type_query(search_input: Locator, query: str, key_events: bool) -> None:
+    """
+    Enter *query* in the search bar.
+
+    fill() sets the whole query at once; the explicit input event and End
+    key trigger the autocomplete without typing char-by-char. Autocompletes
+    that only react to key events get the query typed without delay.
+    """
+    if key_events:
+        search_input.fill("")
+        search_input.press_sequentially(query, delay=0)
+    else:
+        search_input.fill(query)
+        search_input.dispatch_event("input")
+        search_input.press("End")
+
+
+def _wait_for_results(page: Page) -> bool:
+    """Wait briefly for search results; returns False on timeout."""
+    try:
+        page.wait_for_selector(_SEARCH_RESULT_SELECTOR, state="visible", timeout=3000)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
 def _find_search_input(page: Page) -> Locator | None:
-    """Find the search input element using multiple selectors."""
-    selectors = [
-        "input[type='search']",
-        "input[name='search']",
-        "input[name='q']",
-        "input[placeholder*='uscar']",     # Buscar
-        "input[placeholder*='esquis']",    # Pesquisar
-        "input[placeholder*='ivro']",      # livro
-        "#search",
-        ".search-input",
-        "header input[type='text']",
-        "nav input[type='text']",
-        "input[type='text']",              # broad fallback
-    ]
-
-    for sel in selectors:
+    """
+    Find the search input element.
+
+    The candidate selectors are joined into one CSS union so the DOM is
+    queried once instead of probing each selector over the Playwright bridge.
+    """
+    for sel in (_SEARCH_INPUT_SELECTOR, _SEARCH_INPUT_FALLBACK_SELECTOR):
         try:
-            loc = page.locator(sel)
-            if loc.count() > 0 and loc.first.is_visible():
-                logger.debug(f"  Found search input: {sel}")
-                return loc.first
+            loc = page.locator(f"{sel} >> visible=true").first
+            if loc.count() > 0:
+                logger.debug("  Found search input: {}", sel)
+                return loc
         except Exception:
             continue
 
@@ -205,57 +478,27 @@ def _click_dropdown_result(page: Page) -> bool:
     Skoob shows a dropdown with book cards containing title, author,
     and a link to the book detail page.
     """
-    # Selectors for autocomplete dropdown results (based on Skoob's current UI)
-    dropdown_selectors = [
-        # Direct links inside dropdown results
-        ".dropdown-menu a[href*='/livro/']",
-        ".autocomplete a[href*='/livro/']",
-        ".search-results a[href*='/livro/']",
-        ".suggestions a[href*='/livro/']",
-        # Any link to a livro page that appeared after typing
-        "a[href*='/livro/']:not(nav a):not(header a):not(footer a)",
-        # Generic dropdown items
-        ".dropdown-item",
-        ".autocomplete-item",
-        ".suggestion-item",
-        # The book result cards visible in the screenshot
-        ".livro-capa",
-        ".box_livro a",
-    ]
-
-    for sel in dropdown_selectors:
+    # Each tier is one CSS union resolved in a single query; dropdown entries
+    # take priority over result cards elsewhere on the page
+    for sel in (_DROPDOWN_RESULT_SELECTOR, _RESULT_CARD_SELECTOR):
         try:
-            loc = page.locator(sel)
-            count = loc.count()
-            if count > 0:
-                # Click the first visible result
-                for i in range(min(count, 3)):
-                    item = loc.nth(i)
-                    if item.is_visible():
-                        logger.debug(f"  Clicking dropdown result via: {sel} (item {i})")
-                        item.click()
-                        return True
+            item = page.locator(f"{sel} >> visible=true").first
+            if item.count() > 0:
+                logger.debug("  Clicking dropdown result via: {}", sel)
+                item.click()
+                return True
         except Exception:
             continue
 
     # Fallback: look for any visible link containing /livro/ that appeared
-    # after the search (not in the main nav)
+    # after the search (not in the main nav). Evaluated in a single pass
+    # in the page instead of probing each link over the Playwright bridge.
     try:
-        livro_links = page.locator("a[href*='/livro/']")
-        count = livro_links.count()
-        for i in range(count):
-            link = livro_links.nth(i)
-            href = link.get_attribute("href") or ""
-            # Skip navigation/header links, only click search results
-            if "/lista/" in href or "/resenhas/" in href:
-                continue
-            if link.is_visible():
-                box = link.bounding_box()
-                # Only click results that appear below the search bar (y > 80px)
-                if box and box["y"] > 80:
-                    logger.debug(f"  Clicking livro link: {href}")
-                    link.click()
-                    return True
+        href = page.evaluate(_FIND_LIVRO_LINK_JS)
+        if href:
+            logger.debug("  Opening livro link: {}", href)
+            page.goto(urljoin(SKOOB_BASE_URL, href), wait_until="domcontentloaded")
+            return True
     except Exception:
         pass
 
@@ -270,65 +513,19 @@ def _set_status(page: Page, target_status: str, book_title: str) -> bool:
     "Resenhas", plus a "Lido" checkbox or similar control.
     """
     try:
-        logger.debug(f"  Setting status to '{target_status}' on {page.url}")
-
-        # Map status labels to common button text variations on Skoob
-        status_text_variants: dict[str, list[str]] = {
-            "Lido": ["Lido", "lido", "Li", "li"],
-            "Lendo": ["Lendo", "lendo", "Estou lendo"],
-            "Quero Ler": ["Quero ler", "quero ler", "Quero Ler", "VOU LER", "Vou ler"],
-        }
-
-        texts_to_try = status_text_variants.get(target_status, [target_status])
-
-        # Strategy 1: Click button/link by text content
-        for text in texts_to_try:
-            try:
-                # Try exact text match on buttons
-                btn = page.get_by_role("button", name=text, exact=False)
-                if btn.count() > 0 and btn.first.is_visible():
-                    btn.first.click()
-                    page.wait_for_timeout(1500)
-                    logger.debug(f"  Clicked button with text: '{text}'")
-                    return True
-            except Exception:
-                pass
-
-            try:
-                # Try links
-                link = page.get_by_role("link", name=text, exact=False)
-                if link.count() > 0 and link.first.is_visible():
-                    link.first.click()
-                    page.wait_for_timeout(1500)
-                    logger.debug(f"  Clicked link with text: '{text}'")
-                    return True
-            except Exception:
-                pass
+        logger.debug("  Setting status to '{}' on {}", target_status, page.url)
 
-        # Strategy 2: Try by CSS selectors with text match
-        for text in texts_to_try:
-            try:
-                loc = page.locator(f"button:has-text('{text}'), a:has-text('{text}')")
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.click()
-                    page.wait_for_timeout(1500)
-                    return True
-            except Exception:
-                pass
+        selectors = (
+            _STATUS_SELECTORS.get(target_status) or _status_selectors(target_status)
+        )
 
-        # Strategy 3: Try common Skoob button IDs
-        id_selectors = [
-            "#bt_lido", "#bt_lendo", "#bt_quero",
-            "#btn-lido", "#btn-lendo", "#btn-quero",
-            "#btn-status-1", "#btn-status-2", "#btn-status-3",
-        ]
-        for sel in id_selectors:
+        # Each selector is one query; earlier ones (more specific text) win
+        for sel in selectors:
             try:
-                loc = page.locator(sel)
-                if loc.count() > 0 and loc.first.is_visible():
-                    loc.first.click()
-                    page.wait_for_timeout(1500)
-                    logger.debug(f"  Clicked via selector: {sel}")
+                loc = page.locator(f"{sel} >> visible=true").first
+                if loc.count() > 0:
+                    _click_and_wait(page, loc)
+                    logger.debug("  Clicked status control via: {}", sel)
                     return True
             except Exception:
                 pass
@@ -341,8 +538,70 @@ def _set_status(page: Page, target_status: str, book_title: str) -> bool:
         return False
 
 
-def _jitter() -> None:
-    """Random sleep to mimic human behaviour."""
-    delay = random.uniform(JITTER_MIN, JITTER_MAX)
-    logger.debug(f"  Sleeping {delay:.1f}s...")
-    time.sleep(delay)
+def _click_and_wait(page: Page, target: Locator) -> None:
+    """
+    Click *target* and wait for Skoob's bookshelf write (PUT .../bookshelf/add),
+    so we do not navigate away before Skoob has stored the change.
+    """
+    try:
+        with page.expect_response(_is_bookshelf_write, timeout=3000):
+            target.click()
+    except PlaywrightTimeoutError:
+        logger.debug("  No write request observed after click.")
+
+
+def _is_bookshelf_write(response: Response) -> bool:
+    """True for the bookshelf API call that stores a status change."""
+    return (
+        response.request.method in ("POST", "PUT", "PATCH")
+        and response.url.startswith(SKOOB_BOOKSHELF_API_URL)
+    )
+
+
+def _answered_by_cache(url_cache: dict[str, dict[str, Any]], row: Any) -> bool:
+    """True if *url_cache* holds a book URL or a recent "not found" for *row*."""
+    cached = url_cache.get(_url_cache_key(row.clean_isbn, row.clean_title, row.Author))
+    if not cached:
+        return False
+    if cached["url"]:
+        return True
+    return time.time() - cached["checked_at"] < NOT_FOUND_CACHE_TTL
+
+
+def _url_cache_key(isbn: str, clean_title: str, author: str) -> str:
+    """Cache key for a book: its ISBN, or a hash of title and author."""
+    if isbn.strip():
+        return isbn.strip()
+    return hashlib.md5(f"{clean_title}|{author}".encode("utf-8")).hexdigest()
+
+
+def _load_url_cache(path: str = SKOOB_URL_CACHE_FILE) -> dict[str, dict[str, Any]]:
+    """Load the book URL cache, or return an empty one."""
+    cache_path = Path(path)
+    if not cache_path.exists():
+        return {}
+    try:
+        return json.loads(cache_path.read_text(encoding="utf-8"))
+    except Exception as exc:
+        logger.warning(f"Ignoring unreadable URL cache {path}: {exc}")
+        return {}
+
+
+def _save_url_cache(
+    cache: dict[str, dict[str, Any]], path: str = SKOOB_URL_CACHE_FILE
+) -> None:
+    """Write the book URL cache to disk."""
+    Path(path).write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+
+
+def _jitter(already_waited: float = 0.0) -> None:
+    """
+    Random sleep to mimic human behaviour.
+
+    *already_waited* seconds (spent on useful work since the last action)
+    are deducted from the delay.
+    """
+    delay = random.uniform(JITTER_MIN, JITTER_MAX) - already_waited
+    if delay > 0:
+        logger.debug("  Sleeping {:.1f}s...", delay)
+        time.sleep(delay)